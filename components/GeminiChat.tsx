@@ -1,8 +1,22 @@
 
-import React, { useState, useRef, useEffect } from 'react';
-import { GoogleGenAI } from '@google/genai';
+import React, { useState, useRef, useEffect, useMemo } from 'react';
+import type { GoogleGenAI } from '@google/genai';
 import { ChatMessage } from '../types';
 
+let clientPromise: Promise<GoogleGenAI> | null = null;
+
+const getClient = (): Promise<GoogleGenAI> => {
+  if (!clientPromise) {
+    clientPromise = import('@google/genai')
+      .then(({ GoogleGenAI }) => new GoogleGenAI({ apiKey: process.env.API_KEY || '' }))
+      .catch((error) => {
+        clientPromise = null;
+        throw error;
+      });
+  }
+  return clientPromise;
+};
+
 export const GeminiChat: React.FC = () => {
   const [messages, setMessages] = useState<ChatMessage[]>([]);
   const [input, setInput] = useState('');
@@ -15,6 +29,14 @@ export const GeminiChat: React.FC = () => {
     }
   }, [messages]);
 
+  const renderedMessages = useMemo(() => messages.map((m, i) => (
+    <div key={i} className={`${m.role === 'user' ? 'ml-auto text-right' : 'mr-auto text-left'} max-w-[85%]`}>
+      <div className={`inline-block p-4 text-sm ${m.role === 'user' ? 'bg-black text-white' : 'bg-gray-100 text-black'}`}>
+        {m.content}
+      </div>
+    </div>
+  )), [messages]);
+
   const handleSend = async () => {
     if (!input.trim() || isLoading) return;
 
@@ -24,7 +46,7 @@ export const GeminiChat: React.FC = () => {
     setIsLoading(true);
 
     try {
-      const ai = new GoogleGenAI({ apiKey: process.env.API_KEY || '' });
+      const ai = await getClient();
       const response = await ai.models.generateContent({
         model: 'gemini-3-flash-preview',
         contents: [...messages, userMessage].map(m => ({
@@ -54,13 +76,7 @@ export const GeminiChat: React.FC = () => {
             "How do you handle anxiety differently than a regular doctor?"
           </div>
         )}
-        {messages.map((m, i) => (
-          <div key={i} className={`${m.role === 'user' ? 'ml-auto text-right' : 'mr-auto text-left'} max-w-[85%]`}>
-            <div className={`inline-block p-4 text-sm ${m.role === 'user' ? 'bg-black text-white' : 'bg-gray-100 text-black'}`}>
-              {m.content}
-            </div>
-          </div>
-        ))}
+        {renderedMessages}
         {isLoading && (
           <div className="text-[10px] mono animate-pulse uppercase tracking-widest text-gray-400">Typing...</div>
         )}
@@ -2,13 +2,13 @@
 import React from 'react';
 import { SectionProps } from '../types';
 
-export const Insights: React.FC<SectionProps> = ({ id, label, index }) => {
-  const articles = [
-    { title: "The power of saying 'I don't know'", category: "Growth", date: "Nov 20" },
-    { title: "Why we mistake loneliness for failure", category: "Mindset", date: "Dec 01" },
-    { title: "The art of being a human first", category: "Connection", date: "Jan 15" }
-  ];
+const articles = [
+  { title: "The power of saying 'I don't know'", category: "Growth", date: "Nov 20" },
+  { title: "Why we mistake loneliness for failure", category: "Mindset", date: "Dec 01" },
+  { title: "The art of being a human first", category: "Connection", date: "Jan 15" }
+];
 
+export const Insights: React.FC<SectionProps> = ({ id, label, index }) => {
   return (
     <section id={id} className="px-6 max-w-[1400px] mx-auto py-32 border-t border-black/10">
       <div className="flex justify-between items-start mb-24">
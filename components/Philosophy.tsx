@@ -2,14 +2,14 @@
 import React from 'react';
 import { SectionProps } from '../types';
 
-export const Philosophy: React.FC<SectionProps> = ({ id, label, index }) => {
-  const points = [
-    { title: "No clinical jargon", desc: "We speak in plain language about things that hurt." },
-    { title: "Radical Presence", desc: "I don't just 'listen' — I am fully there with you." },
-    { title: "Non-Judgmental Space", desc: "Everything is welcome here. No exceptions." },
-    { title: "Real Conversations", desc: "Expect questions that challenge and comfort in equal measure." }
-  ];
+const points = [
+  { title: "No clinical jargon", desc: "We speak in plain language about things that hurt." },
+  { title: "Radical Presence", desc: "I don't just 'listen' — I am fully there with you." },
+  { title: "Non-Judgmental Space", desc: "Everything is welcome here. No exceptions." },
+  { title: "Real Conversations", desc: "Expect questions that challenge and comfort in equal measure." }
+];
 
+export const Philosophy: React.FC<SectionProps> = ({ id, label, index }) => {
   return (
     <section id={id} className="bg-black text-white px-6 py-32">
       <div className="max-w-[1400px] mx-auto">
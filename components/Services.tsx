@@ -2,16 +2,16 @@
 import React from 'react';
 import { SectionProps } from '../types';
 
-export const Services: React.FC<SectionProps> = ({ id, label, index }) => {
-  const items = [
-    "Crisis Support",
-    "Identity Shifts",
-    "Grief & Loss",
-    "Relationship Burnout",
-    "Executive Loneliness",
-    "Existential Dread"
-  ];
+const items = [
+  "Crisis Support",
+  "Identity Shifts",
+  "Grief & Loss",
+  "Relationship Burnout",
+  "Executive Loneliness",
+  "Existential Dread"
+];
 
+export const Services: React.FC<SectionProps> = ({ id, label, index }) => {
   return (
     <section id={id} className="px-6 max-w-[1400px] mx-auto py-32 border-t border-black/5">
       <div className="flex justify-between items-start mb-24">